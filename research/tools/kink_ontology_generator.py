@@ -1,13 +1,24 @@
 import argparse
+import asyncio
+import functools
 import openai
 import json
 import os
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 client = openai.OpenAI()
+async_client = openai.AsyncOpenAI()
+
+SYSTEM_PROMPT = "You are a skilled assistant specialized in creating detailed hypnokink ontologies. Follow the provided specifications exactly."
 
+@functools.cache
 def load_prompt_template():
-    """Load the prompt template from the docs/prompts directory."""
+    """Load the prompt template from the docs/prompts directory (read once per process)."""
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     # Navigate to the prompt file relative to the script location
@@ -31,32 +42,164 @@ Generate the complete JSON file for the given theme name, following these specif
     except Exception as e:
         sys.exit(f"Error loading prompt file: {e}")
 
+def build_request(theme_name, max_tokens=2000):
+    """Build the chat completion arguments for a single theme."""
+    prompt_template = load_prompt_template()
+    formatted_prompt = prompt_template.format_map({"theme_name": theme_name})
+    return dict(
+        model="gpt-4o",
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": formatted_prompt}
+        ],
+        response_format={"type": "json_object"},
+        max_tokens=max_tokens,
+        temperature=0.1
+    )
+
 def generate_hypnokink_ontology(theme_name, max_tokens=2000):
     """Generate ontology using the loaded prompt template."""
-    prompt_template = load_prompt_template()
-    formatted_prompt = prompt_template.format(theme_name=theme_name)
+    request = build_request(theme_name, max_tokens)
     
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a skilled assistant specialized in creating detailed hypnokink ontologies. Follow the provided specifications exactly."},
-                {"role": "user", "content": formatted_prompt}
-            ],
-            response_format={"type": "json_object"},
-            max_tokens=max_tokens,
-            temperature=0.1
-        )
+        response = client.chat.completions.create(**request)
         return response.choices[0].message.content
     except Exception as e:
         sys.exit(f"Error generating ontology: {e}")
 
+async def agenerate(theme_name, max_tokens=2000, semaphore=None):
+    """Async variant of generate_hypnokink_ontology for batch runs; returns None on failure."""
+    request = build_request(theme_name, max_tokens)
+    
+    try:
+        if semaphore is None:
+            response = await async_client.chat.completions.create(**request)
+        else:
+            async with semaphore:
+                response = await async_client.chat.completions.create(**request)
+        return response.choices[0].message.content
+    except Exception as e:
+        print(f"❌ Error generating ontology for {theme_name}: {e}", file=sys.stderr)
+        return None
+
+async def agenerate_many(theme_names, max_tokens=2000, concurrency=5):
+    """Generate ontologies for many themes concurrently, at most `concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*[agenerate(name, max_tokens, semaphore) for name in theme_names])
+
+def loads_ontology(ontology_str):
+    """Parse the model's JSON reply; raises json.JSONDecodeError on bad input."""
+    if orjson is not None:
+        try:
+            return orjson.loads(ontology_str.encode("utf-8"))
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which stdlib json accepts; let json decide.
+            pass
+    return json.loads(ontology_str)
+
+def dumps_ontology(ontology_json):
+    """Serialize an ontology to UTF-8 bytes in the 4-space format used by ontologies/."""
+    # Deliberately stdlib: orjson only indents by 2, which would reformat every
+    # regenerated theme, and one ~2k-token document gains nothing from it.
+    return json.dumps(ontology_json, indent=4, ensure_ascii=False).encode("utf-8")
+
+def load_theme_names(themes_file):
+    """Read newline-delimited theme names, ignoring blank lines and # comments."""
+    with open(themes_file, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+def theme_file_name(theme_name):
+    """Map a theme name to its ontologies/-style file name, or None if it is not a safe file name."""
+    file_stem = theme_name.replace(" ", "_")
+    if "/" in file_stem or "\\" in file_stem or ".." in file_stem:
+        return None
+    return file_stem + ".json"
+
+def save_ontology(ontology_json, output_path):
+    """Write an ontology to disk, creating the parent folder if needed."""
+    output_folder = os.path.dirname(output_path)
+    if output_folder and not os.path.exists(output_folder):
+        os.makedirs(output_folder)
+    with open(output_path, "wb") as f:
+        f.write(dumps_ontology(ontology_json))
+
+def print_ontology(ontology_json):
+    print("\n" + "="*50)
+    print("GENERATED ONTOLOGY:")
+    print("="*50)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps_ontology(ontology_json) + b"\n")
+    sys.stdout.flush()
+
+def run_batch(args):
+    """Generate every theme listed in --themes-file concurrently."""
+    theme_names = load_theme_names(args.themes_file)
+    if not theme_names:
+        sys.exit(f"No theme names found in {args.themes_file}")
+
+    # Repeated names (including ones that map to the same file) would cost a second
+    # paid request and overwrite the first result, so keep only the first occurrence.
+    unique_names = {}
+    for name in theme_names:
+        unique_names.setdefault(name.replace(" ", "_").lower(), name)
+    if len(unique_names) < len(theme_names):
+        print(f"Skipping {len(theme_names) - len(unique_names)} duplicate theme name(s)", file=sys.stderr)
+    theme_names = list(unique_names.values())
+
+    if args.output:
+        unsafe = [name for name in theme_names if theme_file_name(name) is None]
+        if unsafe:
+            sys.exit(f"Theme names cannot contain path separators or '..': {', '.join(unsafe)}")
+
+    # Load (and cache) the template before fanning out, so a missing file exits
+    # cleanly here instead of raising SystemExit inside the asyncio tasks.
+    load_prompt_template()
+
+    print(f"Generating ontologies for {len(theme_names)} themes (concurrency {args.concurrency})")
+    results = asyncio.run(agenerate_many(theme_names, args.max_tokens, args.concurrency))
+
+    failures = 0
+    for theme_name, ontology_str in zip(theme_names, results):
+        if ontology_str is None:
+            failures += 1
+            continue
+        try:
+            ontology_json = loads_ontology(ontology_str)
+        except json.JSONDecodeError as e:
+            print(f"❌ Failed to parse ontology for {theme_name} as JSON: {e}", file=sys.stderr)
+            failures += 1
+            continue
+
+        if args.output:
+            # In batch mode --output is a folder; files follow the ontologies/ naming.
+            output_path = os.path.join(args.output, theme_file_name(theme_name))
+            save_ontology(ontology_json, output_path)
+            print(f"✅ Ontology for {theme_name} saved to {output_path}")
+        else:
+            print_ontology(ontology_json)
+
+    if failures:
+        sys.exit(f"{failures} of {len(theme_names)} themes failed")
+
 def main():
     parser = argparse.ArgumentParser(description="Generate a hypnokink ontology using the detailed prompt template.")
-    parser.add_argument("theme_name", help="Name of the theme/kink to generate ontology for.")
-    parser.add_argument("--output", "-o", help="Output JSON file path. If not provided, prints to stdout.", default=None)
+    parser.add_argument("theme_name", nargs="?", help="Name of the theme/kink to generate ontology for.")
+    parser.add_argument("--themes-file", "-f", help="File with one theme name per line; generates them concurrently.", default=None)
+    parser.add_argument("--output", "-o", help="Output JSON file path (a folder with --themes-file). If not provided, prints to stdout.", default=None)
     parser.add_argument("--max-tokens", "-t", type=int, help="Maximum tokens for API response.", default=2000)
+    parser.add_argument("--concurrency", "-c", type=int, help="Maximum concurrent API requests with --themes-file; keep within your rate limit.", default=5)
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    if args.themes_file:
+        if args.theme_name:
+            parser.error("pass either theme_name or --themes-file, not both")
+        print("Using prompt template from docs/prompts/Generate_Ontology_Theme.txt")
+        run_batch(args)
+        return
+    if not args.theme_name:
+        parser.error("theme_name is required unless --themes-file is given")
 
     print(f"Generating ontology for theme: {args.theme_name}")
     print("Using prompt template from docs/prompts/Generate_Ontology_Theme.txt")
@@ -64,22 +207,15 @@ def main():
     ontology_str = generate_hypnokink_ontology(args.theme_name, args.max_tokens)
     
     try:
-        ontology_json = json.loads(ontology_str)
+        ontology_json = loads_ontology(ontology_str)
     except json.JSONDecodeError as e:
         sys.exit(f"Failed to parse ontology as JSON: {e}")
 
     if args.output:
-        output_folder = os.path.dirname(args.output)
-        if output_folder and not os.path.exists(output_folder):
-            os.makedirs(output_folder)
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(ontology_json, f, indent=4, ensure_ascii=False)
+        save_ontology(ontology_json, args.output)
         print(f"✅ Ontology saved to {args.output}")
     else:
-        print("\n" + "="*50)
-        print("GENERATED ONTOLOGY:")
-        print("="*50)
-        print(json.dumps(ontology_json, indent=4, ensure_ascii=False))
+        print_ontology(ontology_json)
 
 if __name__ == "__main__":
     main()
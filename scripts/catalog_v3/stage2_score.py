@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Sequence, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used when missing
+    orjson = None
 
 from .config import CatalogConfig
 from .utils import io as io_utils
@@ -18,25 +32,90 @@ logger = logging.getLogger(__name__)
 
 RAW_INPUT_ROOT = Path("data/catalog_v3/raw")
 SCORED_OUTPUT_ROOT = Path("data/catalog_v3/scored")
+SCORE_CACHE_NAME = ".cache.jsonl"
 PROMPT_VERSION = "1.0"
+DEFAULT_PARALLEL = 4
+STAGE1_READ_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+OUTPUT_WRITE_WORKERS = 4
+PROGRESS_FLUSH_LINES = 256
+PROGRESS_FLUSH_SECONDS = 1.0
+
+# Optional ```json fence around the scorer's reply; the closing fence may be missing.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*(.*?)\s*(?:```)?$", re.DOTALL | re.IGNORECASE)
+_REQUIRED_SCORE_FIELDS = frozenset({"score", "verdict", "rationale"})
+
+
+@dataclass
+class _ScoringTask:
+    combo_id: str
+    output_prefix: str
+    source_record: str
+    source_ids: List[str]
+    target_theme: Theme
+    proposal: dict
+    proposal_index: int
+    rationale: str
+
+
+def _default_parallel() -> int:
+    """Read OLLAMA_NUM_PARALLEL, falling back to DEFAULT_PARALLEL if unset or invalid."""
+    try:
+        value = int(os.environ.get("OLLAMA_NUM_PARALLEL", ""))
+    except ValueError:
+        return DEFAULT_PARALLEL
+    return value if value >= 1 else DEFAULT_PARALLEL
 
 
 def _latest_subdir(root: Path) -> Path:
     if not root.exists():
         raise FileNotFoundError(f"No data at {root}")
-    subdirs = sorted([p for p in root.iterdir() if p.is_dir()], reverse=True)
-    if not subdirs:
+    # Subdirectories are timestamp-named, so the latest is simply the max name;
+    # scandir's dirent type avoids a stat per entry (symlinks are still followed).
+    with os.scandir(root) as entries:
+        latest = max((entry.name for entry in entries if entry.is_dir()), default=None)
+    if latest is None:
         raise FileNotFoundError(f"No subdirectories found in {root}")
-    return subdirs[0]
+    return root / latest
+
+
+def _read_stage1_payload(file_path: Path) -> dict:
+    payload = io_utils.read_json(file_path)
+    payload["_source_path"] = file_path
+    return payload
+
+
+def _load_stage1_payloads(file_paths: Iterable[Path]) -> Iterator[dict]:
+    # Reads are I/O-bound and release the GIL, so overlap them on a thread pool;
+    # `map` still yields payloads in input order.
+    with ThreadPoolExecutor(max_workers=STAGE1_READ_WORKERS) as executor:
+        yield from executor.map(_read_stage1_payload, file_paths)
+
+
+def _output_prefix(output_root: str, combo_id: str, sample_index: int, proposal_index: int) -> str:
+    return os.path.join(output_root, f"{combo_id}__sample{sample_index}__{proposal_index}")
+
+
+def _output_path(output_prefix: str, pass_index: int) -> str:
+    # Plain string concatenation: this runs for every (proposal, pass), and a Path
+    # is only materialized for the records that actually get written.
+    return f"{output_prefix}__pass{pass_index}.json"
+
+
+def _json_loads(text: str):
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which stdlib json accepts; let json
+            # decide so such replies parse exactly as they did before.
+            pass
+    return json.loads(text)
 
 
-def _load_stage1_payloads(path: Path) -> List[dict]:
-    payloads: List[dict] = []
-    for file_path in sorted(path.glob("*.json")):
-        payload = io_utils.read_json(file_path)
-        payload["_source_path"] = file_path
-        payloads.append(payload)
-    return payloads
+def _json_dumps(obj) -> str:
+    # Always stdlib, unlike _json_loads: orjson writes NaN/Infinity as null, which
+    # would make replayed cache entries differ from directly scored records.
+    return json.dumps(obj, ensure_ascii=False)
 
 
 def _parse_combo_id(path: Path) -> str:
@@ -45,19 +124,85 @@ def _parse_combo_id(path: Path) -> str:
 
 def _parse_scoring_response(text: str) -> dict:
     cleaned = text.strip()
-    if cleaned.startswith("```"):
-        cleaned = cleaned.strip("`")
-        if cleaned.lower().startswith("json"):
-            cleaned = cleaned[4:].strip()
+    match = _FENCE_RE.match(cleaned)
+    if match:
+        cleaned = match.group(1)
     try:
-        data = json.loads(cleaned)
+        data = _json_loads(cleaned)
     except json.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON from scorer: {exc}\n{text}") from exc
-    if "score" not in data or "verdict" not in data or "rationale" not in data:
+    if not _REQUIRED_SCORE_FIELDS.issubset(data):
         raise ValueError(f"Scoring response missing fields: {data}")
     return data
 
 
+def _prompt_hash(prompt: str) -> str:
+    return hashlib.blake2b(prompt.encode("utf-8")).hexdigest()[:16]
+
+
+ScoreCacheKey = Tuple[str, str, str, int, str]
+
+
+def _score_cache_key(
+    model: str, prompt_version: str, prompt_hash: str, pass_index: int, options: dict
+) -> ScoreCacheKey:
+    # Sampling options (seed included) are part of the key so a resume after a
+    # temperature/top_p change never replays replies scored under other settings.
+    return (model, prompt_version, prompt_hash, pass_index, json.dumps(options, sort_keys=True))
+
+
+def _load_score_cache(path: Path) -> Dict[ScoreCacheKey, dict]:
+    cache: Dict[ScoreCacheKey, dict] = {}
+    if not path.exists():
+        return cache
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = _json_loads(line)
+            except json.JSONDecodeError:
+                # Tolerate a truncated trailing line from an interrupted run.
+                continue
+            if "prompt_version" not in entry or "options" not in entry:
+                # Entries from before options were recorded cannot be matched safely.
+                continue
+            key = _score_cache_key(
+                entry["scoring_model"],
+                entry["prompt_version"],
+                entry["prompt_hash"],
+                entry["pass_index"],
+                entry["options"],
+            )
+            cache[key] = entry
+    return cache
+
+
+def _resolve_target(
+    target_id: str,
+    target_name: str,
+    targets_by_id: Dict[str, Theme | None],
+    targets_by_name: Dict[str, Theme],
+) -> Theme | None:
+    key = target_id.lower()
+    if key in targets_by_id:
+        return targets_by_id[key]
+    theme = targets_by_name.get(target_name.lower())
+    if theme is None:
+        # Not among the selected themes: probe the ontology once and remember the
+        # outcome (including misses) so later proposals never touch the disk.
+        for candidate in (target_name, target_id):
+            try:
+                theme = load_theme(candidate)
+            except FileNotFoundError:
+                continue
+            targets_by_name[theme.name.lower()] = theme
+            break
+    targets_by_id[key] = theme
+    return theme
+
+
 def _resolve_sources(source_ids: Iterable[str], theme_index: Dict[str, Theme]) -> List[Theme]:
     sources: List[Theme] = []
     for source_id in source_ids:
@@ -74,6 +219,8 @@ def score(
     input_dir: Path | None,
     model_override: str | None,
     passes_override: int | None,
+    parallel_override: int | None,
+    hosts_override: Sequence[str] | None,
     include_prompt: bool,
     start_index: int,
     limit: int | None,
@@ -84,25 +231,26 @@ def score(
     selected_names = config.selected_themes()
     themes = load_themes(selected_names)
     theme_index: Dict[str, Theme] = {theme.id: theme for theme in themes}
+    targets_by_id: Dict[str, Theme | None] = {theme.id.lower(): theme for theme in themes}
+    targets_by_name: Dict[str, Theme] = {theme.name.lower(): theme for theme in themes}
 
     base_dir = input_dir or _latest_subdir(RAW_INPUT_ROOT)
     logger.info("Using Stage 1 data from %s", base_dir)
-    payloads = _load_stage1_payloads(base_dir)
-    total_records = len(payloads)
-    logger.info("Loaded %s proposal records", total_records)
-
-    if start_index:
-        payloads = payloads[start_index:]
-    if limit is not None:
-        payloads = payloads[:limit]
-    if not payloads:
+    # Sort file names only; JSON is read lazily and records outside the
+    # start/limit window are never parsed.
+    stage1_files = sorted(base_dir.glob("*.json"))
+    total_records = len(stage1_files)
+    logger.info("Found %s proposal records", total_records)
+
+    stop = start_index + limit if limit is not None else None
+    selected_files = stage1_files[start_index:stop]
+    if not selected_files:
         logger.info("No proposal records to process (start/limit exhausted list).")
         return
+    payloads = _load_stage1_payloads(selected_files)
 
-    client = OllamaClient(
-        host=config.ollama.host,
-        timeout=config.ollama.timeout,
-    )
+    hosts = list(hosts_override or [config.ollama.host])
+    clients = [OllamaClient(host=host, timeout=config.ollama.timeout) for host in hosts]
     if output_dir:
         output_root = io_utils.ensure_dir(output_dir)
     else:
@@ -111,120 +259,298 @@ def score(
 
     model = model_override or config.scoring.model
     passes = passes_override or config.scoring.passes
+    parallel = parallel_override if parallel_override is not None else _default_parallel()
+    if parallel < 1:
+        raise ValueError(f"parallel must be at least 1, got {parallel}")
     options = {
         "temperature": config.scoring.temperature,
         "top_p": config.scoring.top_p,
         "repeat_penalty": config.scoring.repeat_penalty,
     }
 
-    target_cache: Dict[str, Theme] = {}
+    prompt_hashes: Dict[Tuple[Tuple[str, ...], str, str], str] = {}
+    # prompt hash -> (prompt, every proposal that renders to it); each unique prompt
+    # is scored once per pass and the result fanned back out to all its outputs.
+    work: Dict[str, Tuple[str, List[_ScoringTask]]] = {}
+    output_root_str = os.fspath(output_root)
+    cache_path = output_root / SCORE_CACHE_NAME
+    # --no-skip-existing means re-score, so cached replies are only replayed on resume.
+    score_cache = _load_score_cache(cache_path) if skip_existing else {}
 
+    progress_handle: TextIO | None = None
     if progress_log:
         progress_log.parent.mkdir(parents=True, exist_ok=True)
+        # Keep one handle for the whole run rather than reopening the file per
+        # event; every call happens on the event loop thread, so no lock.
+        progress_handle = progress_log.open("a", encoding="utf-8")
+
+    # Lines are batched and written together once PROGRESS_FLUSH_LINES accumulate
+    # or PROGRESS_FLUSH_SECONDS pass, trading a little freshness for fewer writes.
+    progress_buffer: Deque[str] = deque()
+    last_flush = time.monotonic()
+
+    def flush_progress() -> None:
+        nonlocal last_flush
+        if progress_handle is None or not progress_buffer:
+            return
+        progress_handle.write("".join(progress_buffer))
+        progress_handle.flush()
+        progress_buffer.clear()
+        last_flush = time.monotonic()
 
     def log_progress(message: str) -> None:
-        if not progress_log:
+        if progress_handle is None:
             return
         stamp = datetime.now(timezone.utc).isoformat()
-        with progress_log.open("a", encoding="utf-8") as handle:
-            handle.write(f"{stamp} {message}\n")
+        progress_buffer.append(f"{stamp} {message}\n")
+        if (
+            len(progress_buffer) >= PROGRESS_FLUSH_LINES
+            or time.monotonic() - last_flush >= PROGRESS_FLUSH_SECONDS
+        ):
+            flush_progress()
 
-    for offset, payload in enumerate(payloads, start=0):
-        source_ids = payload.get("sources", [])
-        try:
-            sources = _resolve_sources(source_ids, theme_index)
-        except KeyError as exc:
-            logger.warning("Skipping payload %s: %s", payload.get("_source_path"), exc)
-            log_progress(f"SKIP unknown source {payload.get('_source_path')}: {exc}")
-            continue
-
-        parsed = payload.get("parsed", {})
-        proposals = parsed.get("proposals", [])
-        if not proposals:
-            continue
-
-        combo_id = _parse_combo_id(payload["_source_path"])
-        absolute_index = start_index + offset + 1
-        logger.info("Scoring record %s/%s (%s)", absolute_index, total_records, combo_id)
-        log_progress(f"START {absolute_index}/{total_records} {combo_id}")
-        for proposal_index, proposal in enumerate(proposals):
-            target_id = proposal.get("target_id") or proposal.get("target_name")
-            target_name = proposal.get("target_name") or target_id
-            rationale = proposal.get("rationale", "").strip()
-            if not target_id or not target_name:
-                logger.info("Skipping proposal without target in %s", combo_id)
-                log_progress(f"SKIP missing target fields {combo_id} proposal {proposal_index}")
+    try:
+        for offset, payload in enumerate(payloads, start=0):
+            src_path = payload["_source_path"]
+            source_ids = payload.get("sources", [])
+            try:
+                sources = _resolve_sources(source_ids, theme_index)
+            except KeyError as exc:
+                logger.warning("Skipping payload %s: %s", src_path, exc)
+                log_progress(f"SKIP unknown source {src_path}: {exc}")
                 continue
 
-            cache_key = target_id.lower()
-            target_theme = target_cache.get(cache_key)
-            if target_theme is None:
-                try:
-                    target_theme = load_theme(target_name)
-                except FileNotFoundError:
-                    try:
-                        target_theme = load_theme(target_id)
-                    except FileNotFoundError:
-                        logger.info("Target theme not found: %s (proposal %s)", target_name, combo_id)
-                        log_progress(
-                            f"SKIP missing target theme {combo_id} proposal {proposal_index}: {target_name}"
-                        )
-                        continue
-                target_cache[cache_key] = target_theme
+            parsed = payload.get("parsed", {})
+            proposals = parsed.get("proposals", [])
+            if not proposals:
+                continue
+
+            # Constant for every proposal and pass of this payload.
+            source_ids_out = [theme.id for theme in sources]
+            source_key = tuple(source_ids_out)
+            source_record_str = str(src_path)
+            combo_id = _parse_combo_id(src_path)
+            sample_index = payload.get("sample_index", 0)
+
+            absolute_index = start_index + offset + 1
+            logger.info("Queued record %s/%s (%s)", absolute_index, total_records, combo_id)
+            log_progress(f"QUEUE {absolute_index}/{total_records} {combo_id}")
+            for proposal_index, proposal in enumerate(proposals):
+                target_id = proposal.get("target_id") or proposal.get("target_name")
+                target_name = proposal.get("target_name") or target_id
+                rationale = proposal.get("rationale", "").strip()
+                if not target_id or not target_name:
+                    logger.info("Skipping proposal without target in %s", combo_id)
+                    log_progress(f"SKIP missing target fields {combo_id} proposal {proposal_index}")
+                    continue
+
+                output_prefix = _output_prefix(output_root_str, combo_id, sample_index, proposal_index)
+                if skip_existing and all(
+                    os.path.exists(_output_path(output_prefix, pass_index)) for pass_index in range(passes)
+                ):
+                    log_progress(f"SKIP existing {combo_id} proposal {proposal_index}")
+                    continue
+
+                target_theme = _resolve_target(target_id, target_name, targets_by_id, targets_by_name)
+                if target_theme is None:
+                    logger.info("Target theme not found: %s (proposal %s)", target_name, combo_id)
+                    log_progress(
+                        f"SKIP missing target theme {combo_id} proposal {proposal_index}: {target_name}"
+                    )
+                    continue
 
-            prompt = render_scoring_prompt(sources, target_theme, rationale)
-            for pass_index in range(passes):
-                response_text = client.generate(model=model, prompt=prompt, options=options)
+                prompt_key = (source_key, target_theme.id, rationale)
+                prompt_hash = prompt_hashes.get(prompt_key)
+                if prompt_hash is None:
+                    prompt = render_scoring_prompt(sources, target_theme, rationale)
+                    prompt_hash = _prompt_hash(prompt)
+                    prompt_hashes[prompt_key] = prompt_hash
+                    work.setdefault(prompt_hash, (prompt, []))
+                work[prompt_hash][1].append(
+                    _ScoringTask(
+                        combo_id=combo_id,
+                        output_prefix=output_prefix,
+                        source_record=source_record_str,
+                        source_ids=source_ids_out,
+                        target_theme=target_theme,
+                        proposal=proposal,
+                        proposal_index=proposal_index,
+                        rationale=rationale,
+                    )
+                )
+
+        total_units = len(work) * passes
+        completed_units = 0
+
+        def mark_done(prompt_hash: str, pass_index: int) -> None:
+            nonlocal completed_units
+            completed_units += 1
+            logger.info(
+                "Scored unit %s/%s (prompt %s pass %s)", completed_units, total_units, prompt_hash, pass_index
+            )
+            log_progress(f"PROGRESS {completed_units}/{total_units} units done")
+
+        async def _score_one(
+            prompt_hash: str,
+            pass_index: int,
+            client: OllamaClient,
+            semaphore: asyncio.Semaphore,
+            cache_handle: TextIO,
+            write_pool: ThreadPoolExecutor,
+        ) -> None:
+            loop = asyncio.get_running_loop()
+            prompt, tasks = work[prompt_hash]
+            pending = [(task, _output_path(task.output_prefix, pass_index)) for task in tasks]
+            if skip_existing:
+                pending = [(task, output_path) for task, output_path in pending if not os.path.exists(output_path)]
+                if not pending:
+                    log_progress(f"SKIP existing prompt {prompt_hash} pass {pass_index}")
+                    mark_done(prompt_hash, pass_index)
+                    return
+
+            # A distinct seed per pass keeps the samples independent while the identical
+            # prompt lets Ollama reuse the prefill for passes that land concurrently.
+            pass_options = {**options, "seed": pass_index}
+            cache_key = _score_cache_key(model, PROMPT_VERSION, prompt_hash, pass_index, pass_options)
+            cached = score_cache.get(cache_key)
+            if cached is not None:
+                response_text = cached["raw_response"]
+                parsed_score = cached["parsed"]
+            else:
+                async with semaphore:
+                    response_text = await asyncio.to_thread(
+                        client.generate, model=model, prompt=prompt, options=pass_options
+                    )
                 try:
                     parsed_score = _parse_scoring_response(response_text)
                 except ValueError as exc:
                     logger.error(
                         "Failed to parse scoring response for %s proposal %s pass %s: %s",
-                        combo_id,
-                        proposal_index,
+                        tasks[0].combo_id,
+                        tasks[0].proposal_index,
                         pass_index,
                         exc,
                     )
                     parsed_score = {"error": str(exc), "raw_response": response_text}
-
+                else:
+                    entry = {
+                        "scoring_model": model,
+                        "prompt_version": PROMPT_VERSION,
+                        "prompt_hash": prompt_hash,
+                        "pass_index": pass_index,
+                        "options": pass_options,
+                        "raw_response": response_text,
+                        "parsed": parsed_score,
+                    }
+                    cache_handle.write(_json_dumps(entry) + "\n")
+
+            for task, output_path in pending:
                 record = {
                     "scoring_model": model,
                     "prompt_version": PROMPT_VERSION,
-                    "sources": [theme.id for theme in sources],
-                    "target": target_theme.id,
-                    "target_name": target_theme.name,
+                    "sources": task.source_ids,
+                    "target": task.target_theme.id,
+                    "target_name": task.target_theme.name,
                     "proposal": {
-                        "source_record": str(payload.get("_source_path")),
-                        "proposal_index": proposal_index,
-                        "rationale": rationale,
-                        "confidence_hint": proposal.get("confidence_hint"),
-                        "raw": proposal,
+                        "source_record": task.source_record,
+                        "proposal_index": task.proposal_index,
+                        "rationale": task.rationale,
+                        "confidence_hint": task.proposal.get("confidence_hint"),
+                        "raw": task.proposal,
                     },
                     "pass_index": pass_index,
-                    "options": options,
+                    "options": pass_options,
                     "raw_response": response_text,
                     "parsed": parsed_score,
                 }
                 if include_prompt:
                     record["prompt"] = prompt
 
-                output_path = output_root / f"{combo_id}__sample{payload.get('sample_index', 0)}__{proposal_index}__pass{pass_index}.json"
-                if skip_existing and output_path.exists():
-                    continue
-                io_utils.write_json(output_path, record)
+                # Hand the write to the pool so the loop can keep dispatching requests.
+                await loop.run_in_executor(write_pool, io_utils.write_json, Path(output_path), record)
                 log_progress(
-                    f"WRITE {combo_id} proposal {proposal_index} pass {pass_index} -> {output_path.name}"
+                    f"WRITE {task.combo_id} proposal {task.proposal_index} pass {pass_index} -> {os.path.basename(output_path)}"
                 )
+            mark_done(prompt_hash, pass_index)
+
+        async def _run() -> None:
+            # The Ollama client is blocking, so give the loop enough worker threads to
+            # keep `parallel` requests in flight on every host at once.
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=parallel * len(clients))
+            )
+            # Each host is its own replica with its own parallel budget. Prompts are
+            # sharded round-robin, but all passes of a prompt stay on one host so they
+            # still share its prefill.
+            host_slots = [(client, asyncio.Semaphore(parallel)) for client in clients]
+            with cache_path.open("a", encoding="utf-8") as cache_handle:
+                with ThreadPoolExecutor(max_workers=OUTPUT_WRITE_WORKERS) as write_pool:
+                    await asyncio.gather(
+                        *(
+                            _score_one(prompt_hash, pass_index, client, semaphore, cache_handle, write_pool)
+                            for prompt_hash, (client, semaphore) in zip(work, itertools.cycle(host_slots))
+                            for pass_index in range(passes)
+                        )
+                    )
 
-    logger.info("Stage 2 completed. Results saved to %s", output_root)
-    log_progress(f"DONE wrote results to {output_root}")
+        proposal_count = sum(len(tasks) for _, tasks in work.values())
+        logger.info(
+            "Dispatching %s unique prompts for %s proposals x %s passes "
+            "(%s host(s), parallel=%s each, %s cache entries)",
+            len(work),
+            proposal_count,
+            passes,
+            len(clients),
+            parallel,
+            len(score_cache),
+        )
+        asyncio.run(_run())
+
+        logger.info("Stage 2 completed. Results saved to %s", output_root)
+        log_progress(f"DONE wrote results to {output_root}")
+    finally:
+        if progress_handle is not None:
+            flush_progress()
+            progress_handle.close()
+
+
+CLI_EPILOG = """\
+Ollama server tuning (set in the server's environment, not this script's):
+  OLLAMA_NUM_PARALLEL   concurrent requests per loaded model; pass the same value to --parallel
+  OLLAMA_KEEP_ALIVE     how long the model stays resident between requests, e.g. 30m, so
+                        gaps between fan-outs do not trigger a reload
+
+Multiple replicas: run one `ollama serve` per GPU, e.g.
+  CUDA_VISIBLE_DEVICES=0 OLLAMA_HOST=127.0.0.1:11434 ollama serve
+  CUDA_VISIBLE_DEVICES=1 OLLAMA_HOST=127.0.0.1:11435 ollama serve
+and pass each with --ollama-host; prompts are sharded round-robin across them.
+"""
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Stage 2: score candidate theme transitions.")
+    parser = argparse.ArgumentParser(
+        description="Stage 2: score candidate theme transitions.",
+        epilog=CLI_EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
     parser.add_argument("--input", type=Path, help="Path to Stage 1 directory (defaults to latest).")
     parser.add_argument("--model", help="Override scoring model.")
     parser.add_argument("--passes", type=int, help="Override number of scoring passes.")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        help=(
+            "Concurrent Ollama requests per host (defaults to $OLLAMA_NUM_PARALLEL or 4). "
+            "Match the server's OLLAMA_NUM_PARALLEL setting; higher values only queue server-side."
+        ),
+    )
+    parser.add_argument(
+        "--ollama-host",
+        dest="ollama_hosts",
+        action="append",
+        metavar="URL",
+        help="Ollama server to score against; repeat to shard across replicas (defaults to the config host).",
+    )
     parser.add_argument("--include-prompt", action="store_true", help="Persist prompt text with each record.")
     parser.add_argument("--start-index", type=int, default=0, help="Skip the first N proposal records.")
     parser.add_argument("--limit", type=int, help="Limit number of proposal records.")
@@ -235,7 +561,10 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         type=Path,
         help="Append progress messages to this file for long-running jobs.",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.parallel is not None and args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    return args
 
 
 def main(argv: Sequence[str] | None = None) -> None:
@@ -246,6 +575,8 @@ def main(argv: Sequence[str] | None = None) -> None:
         input_dir=args.input,
         model_override=args.model,
         passes_override=args.passes,
+        parallel_override=args.parallel,
+        hosts_override=args.ollama_hosts,
         include_prompt=args.include_prompt,
         start_index=args.start_index,
         limit=args.limit,